@@ -9,15 +9,43 @@ LAYER 3: Image prompt synthesis (geometric specifications for generators)
 
 from fastmcp import FastMCP
 from typing import Literal, Optional
+import functools
 import json
+import math
+import os
+from math import atan, cos, degrees, radians
+from types import MappingProxyType
+
+try:
+    import orjson
+except ImportError:  # optional: pip install window-display-mcp[fast]
+    orjson = None
 
 mcp = FastMCP("Window Display Visual Merchandising")
 
+
+# Responses are consumed by agents, so JSON is compact unless pretty output
+# is requested for manual inspection.
+_PRETTY_JSON = os.environ.get("WINDOW_DISPLAY_PRETTY_JSON", "").lower() in ("1", "true", "yes")
+
+
+def _dumps(obj) -> str:
+    """Serialize a tool response as JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if _PRETTY_JSON else None).decode()
+    if _PRETTY_JSON:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(",", ":"))
+
 # ============================================================================
 # LAYER 1: CATEGORICAL TAXONOMY
 # ============================================================================
+#
+# Taxonomy tables are read-only mappings: serialized responses and memoized
+# results are derived from them, so they must never change at runtime.
+# ============================================================================
 
-COMPOSITION_TYPES = {
+COMPOSITION_TYPES = MappingProxyType({
     "pyramidal": {
         "description": "Stable hierarchical arrangement with apex focal point",
         "eye_movement": "upward_convergent",
@@ -60,9 +88,9 @@ COMPOSITION_TYPES = {
         "typical_ratios": {"spacing": 0.30, "vertex_angle": 60},
         "retail_contexts": ["collection", "coordinated_set", "balanced_variety"]
     }
-}
+})
 
-DEPTH_STAGING = {
+DEPTH_STAGING = MappingProxyType({
     "compressed_2d": {
         "description": "Flat graphic composition maximizing window glass plane",
         "depth_zones": 1,
@@ -87,9 +115,9 @@ DEPTH_STAGING = {
         "viewing_distance": "intimate_6ft",
         "spatial_compression": 0.60
     }
-}
+})
 
-LIGHTING_FRAMEWORKS = {
+LIGHTING_FRAMEWORKS = MappingProxyType({
     "accent_dramatic": {
         "description": "High-contrast accent spots creating sculptural shadows",
         "key_angle": 35,
@@ -130,9 +158,9 @@ LIGHTING_FRAMEWORKS = {
         "color_temperature": 4000,
         "shadow_quality": "minimal"
     }
-}
+})
 
-SIGHT_LINE_GEOMETRY = {
+SIGHT_LINE_GEOMETRY = MappingProxyType({
     "street_pedestrian": {
         "description": "Typical adult walking at sidewalk distance",
         "viewing_angle": 25,
@@ -161,6 +189,51 @@ SIGHT_LINE_GEOMETRY = {
         "eye_height_in": 120,
         "optimal_focal_height": 0.35
     }
+})
+
+# ============================================================================
+# LAYER 1 SERIALIZED RESPONSES
+# ============================================================================
+#
+# Taxonomy responses depend only on the immutable dicts above (and, for the
+# specification tools, on a small Literal enum), so they are serialized once
+# at import and served as-is. Tools return the cached str object itself, so
+# the hot path allocates nothing; str rather than bytes is kept because the
+# tools are declared "-> str" and FastMCP treats bytes as binary content.
+# ============================================================================
+
+_COMPOSITION_LIST_JSON = _dumps({
+    "composition_types": dict(COMPOSITION_TYPES),
+    "count": len(COMPOSITION_TYPES),
+    "layer": "taxonomy",
+    "cost_tokens": 0
+})
+
+_COMPOSITION_SPECS_JSON = {
+    composition_type: _dumps({
+        "composition_type": composition_type,
+        "specifications": specs,
+        "layer": "taxonomy",
+        "cost_tokens": 0
+    })
+    for composition_type, specs in COMPOSITION_TYPES.items()
+}
+
+_LIGHTING_LIST_JSON = _dumps({
+    "lighting_frameworks": dict(LIGHTING_FRAMEWORKS),
+    "count": len(LIGHTING_FRAMEWORKS),
+    "layer": "taxonomy",
+    "cost_tokens": 0
+})
+
+_SIGHT_LINE_JSON = {
+    viewer_context: _dumps({
+        "viewer_context": viewer_context,
+        "geometry": geometry,
+        "layer": "taxonomy",
+        "cost_tokens": 0
+    })
+    for viewer_context, geometry in SIGHT_LINE_GEOMETRY.items()
 }
 
 # ============================================================================
@@ -176,12 +249,7 @@ def list_composition_types() -> str:
     
     Returns: JSON with composition types, eye movement patterns, and retail contexts
     """
-    return json.dumps({
-        "composition_types": COMPOSITION_TYPES,
-        "count": len(COMPOSITION_TYPES),
-        "layer": "taxonomy",
-        "cost_tokens": 0
-    }, indent=2)
+    return _COMPOSITION_LIST_JSON
 
 @mcp.tool()
 def get_composition_specifications(
@@ -200,14 +268,16 @@ def get_composition_specifications(
         
     Returns: Complete specifications including ratios and contexts
     """
-    specs = COMPOSITION_TYPES.get(composition_type)
+    cached = _COMPOSITION_SPECS_JSON.get(composition_type)
+    if cached is not None:
+        return cached
     
-    return json.dumps({
+    return _dumps({
         "composition_type": composition_type,
-        "specifications": specs,
+        "specifications": None,
         "layer": "taxonomy",
         "cost_tokens": 0
-    }, indent=2)
+    })
 
 @mcp.tool()
 def list_lighting_frameworks() -> str:
@@ -218,12 +288,7 @@ def list_lighting_frameworks() -> str:
     
     Returns: JSON with lighting types, angles, ratios, and shadow qualities
     """
-    return json.dumps({
-        "lighting_frameworks": LIGHTING_FRAMEWORKS,
-        "count": len(LIGHTING_FRAMEWORKS),
-        "layer": "taxonomy",
-        "cost_tokens": 0
-    }, indent=2)
+    return _LIGHTING_LIST_JSON
 
 @mcp.tool()
 def get_sight_line_geometry(
@@ -242,25 +307,83 @@ def get_sight_line_geometry(
         
     Returns: Viewing angles, distances, and optimal focal placement
     """
-    geometry = SIGHT_LINE_GEOMETRY.get(viewer_context)
+    cached = _SIGHT_LINE_JSON.get(viewer_context)
+    if cached is not None:
+        return cached
     
-    return json.dumps({
+    return _dumps({
         "viewer_context": viewer_context,
-        "geometry": geometry,
+        "geometry": None,
         "layer": "taxonomy",
         "cost_tokens": 0
-    }, indent=2)
+    })
 
 # ============================================================================
 # LAYER 2: DETERMINISTIC PARAMETER MAPPING
 # ============================================================================
 
+_PHI = 1.618033988749895
+_INV_PHI = 1 / _PHI
+_PHI_MINUS_1 = _PHI - 1
+
+# Cosine of every viewing angle in the sight line taxonomy
+_VIEWING_ANGLE_COS = {
+    spec["viewing_angle"]: cos(radians(spec["viewing_angle"]))
+    for spec in SIGHT_LINE_GEOMETRY.values()
+}
+
+# Focal point as (x, y) fractions of the window per composition type.
+# A y of None places the focal point at the viewer's optimal focal height.
+_FOCAL_RATIOS = {
+    "pyramidal": (0.50, COMPOSITION_TYPES["pyramidal"]["typical_ratios"]["apex_height"]),
+    "isolation": (_PHI_MINUS_1, None),
+    "radial": (0.50, 0.50),
+    "triangular_cluster": (_PHI_MINUS_1, 0.55),
+}
+_DEFAULT_FOCAL_RATIOS = (0.50, None)
+
+# Focal fractions resolved for every (composition, viewer) pair, so the
+# mapping reads both ratios with a single lookup.
+_FOCAL_POINT_RATIOS = {
+    (composition_type, viewer_context): (
+        x_ratio,
+        sight_specs["optimal_focal_height"] if y_ratio is None else y_ratio
+    )
+    for composition_type, (x_ratio, y_ratio) in (
+        (c, _FOCAL_RATIOS.get(c, _DEFAULT_FOCAL_RATIOS)) for c in COMPOSITION_TYPES
+    )
+    for viewer_context, sight_specs in SIGHT_LINE_GEOMETRY.items()
+}
+
+_NEGATIVE_SPACE_RATIOS = {
+    "isolation": COMPOSITION_TYPES["isolation"]["typical_ratios"]["negative_space"],
+    "repetition": 0.20,
+}
+_DEFAULT_NEGATIVE_SPACE_RATIO = 0.40
+
+# Depth zone layouts keyed by DEPTH_STAGING["depth_zones"]. These are shared
+# by every mapping result (and serialized directly), so readers must not
+# mutate them; plain dicts are kept because json cannot encode mapping proxies.
+_DEPTH_ZONE_LAYOUTS = {
+    3: {
+        "foreground": {"distance_ft": 1.0, "scale": 1.0},
+        "midground": {"distance_ft": 3.5, "scale": 0.75},
+        "background": {"distance_ft": 6.0, "scale": 0.50}
+    },
+    2: {
+        "focal_plane": {"distance_ft": 2.0, "scale": 1.0},
+        "background": {"distance_ft": 5.0, "scale": 0.70}
+    },
+}
+_DEFAULT_DEPTH_ZONES = {
+    "single_plane": {"distance_ft": 0.5, "scale": 1.0}
+}
+
 def calculate_golden_ratio_offset(dimension: float, use_minor: bool = False) -> float:
     """Calculate golden ratio offset from dimension."""
-    phi = 1.618033988749895
     if use_minor:
-        return dimension * (1 / phi)  # 0.618...
-    return dimension * (phi - 1)  # 0.382...
+        return dimension * _INV_PHI  # 1/phi
+    return dimension * _PHI_MINUS_1  # phi - 1
 
 def calculate_viewing_cone(
     window_width_ft: float,
@@ -269,36 +392,29 @@ def calculate_viewing_cone(
     viewing_angle_deg: float
 ) -> dict:
     """Calculate effective viewing cone and optimal focal zones."""
-    import math
-    
-    # Convert angle to radians
-    angle_rad = math.radians(viewing_angle_deg)
-    
-    # Calculate visible height based on viewing angle
-    effective_height = window_height_ft * math.cos(angle_rad)
-    
-    # Calculate horizontal field of view
-    horizontal_fov = 2 * math.atan(window_width_ft / (2 * viewing_distance_ft))
-    horizontal_fov_deg = math.degrees(horizontal_fov)
-    
-    # Optimal focal zone (center 40% of window)
-    focal_zone_left = window_width_ft * 0.30
-    focal_zone_right = window_width_ft * 0.70
-    focal_zone_bottom = window_height_ft * 0.35
-    focal_zone_top = window_height_ft * 0.65
+    # Taxonomy angles are precomputed; arbitrary angles fall back to math
+    angle_cos = _VIEWING_ANGLE_COS.get(viewing_angle_deg)
+    if angle_cos is None:
+        angle_cos = cos(radians(viewing_angle_deg))
     
     return {
-        "effective_height_ft": round(effective_height, 2),
-        "horizontal_fov_deg": round(horizontal_fov_deg, 1),
+        # Visible height based on viewing angle
+        "effective_height_ft": round(window_height_ft * angle_cos, 2),
+        # Horizontal field of view
+        "horizontal_fov_deg": round(
+            degrees(2 * atan(window_width_ft / (2 * viewing_distance_ft))), 1
+        ),
+        # Optimal focal zone (center 40% of window)
         "focal_zone_coords": {
-            "left_ft": round(focal_zone_left, 2),
-            "right_ft": round(focal_zone_right, 2),
-            "bottom_ft": round(focal_zone_bottom, 2),
-            "top_ft": round(focal_zone_top, 2)
+            "left_ft": round(window_width_ft * 0.30, 2),
+            "right_ft": round(window_width_ft * 0.70, 2),
+            "bottom_ft": round(window_height_ft * 0.35, 2),
+            "top_ft": round(window_height_ft * 0.65, 2)
         },
         "viewing_angle_impact": "compressed" if abs(viewing_angle_deg) > 30 else "natural"
     }
 
+@functools.lru_cache(maxsize=2048, typed=True)
 def _map_display_parameters_internal(
     window_width_ft: float,
     window_height_ft: float,
@@ -307,7 +423,12 @@ def _map_display_parameters_internal(
     lighting_framework: str,
     viewer_context: str
 ) -> dict:
-    """Internal version that returns dict directly (for use by other tools)."""
+    """
+    Internal version that returns dict directly (for use by other tools).
+
+    The mapping is a pure function of its arguments, so results are memoized.
+    The returned dict is shared between callers and must not be mutated.
+    """
     # Get taxonomy data
     comp_specs = COMPOSITION_TYPES[composition_type]
     depth_specs = DEPTH_STAGING[depth_staging]
@@ -323,46 +444,15 @@ def _map_display_parameters_internal(
     )
     
     # Calculate focal point based on composition
-    if composition_type == "pyramidal":
-        focal_x = window_width_ft * 0.50  # Center
-        focal_y = window_height_ft * comp_specs["typical_ratios"]["apex_height"]
-    elif composition_type == "isolation":
-        focal_x = window_width_ft * calculate_golden_ratio_offset(1.0)
-        focal_y = window_height_ft * sight_specs["optimal_focal_height"]
-    elif composition_type == "radial":
-        focal_x = window_width_ft * 0.50
-        focal_y = window_height_ft * 0.50
-    elif composition_type == "triangular_cluster":
-        focal_x = window_width_ft * calculate_golden_ratio_offset(1.0)
-        focal_y = window_height_ft * 0.55
-    else:
-        focal_x = window_width_ft * 0.50
-        focal_y = window_height_ft * sight_specs["optimal_focal_height"]
+    focal_x_ratio, focal_y_ratio = _FOCAL_POINT_RATIOS[(composition_type, viewer_context)]
+    focal_x = window_width_ft * focal_x_ratio
+    focal_y = window_height_ft * focal_y_ratio
     
     # Calculate negative space ratio
-    if composition_type == "isolation":
-        negative_space_ratio = comp_specs["typical_ratios"]["negative_space"]
-    elif composition_type == "repetition":
-        negative_space_ratio = 0.20
-    else:
-        negative_space_ratio = 0.40
+    negative_space_ratio = _NEGATIVE_SPACE_RATIOS.get(composition_type, _DEFAULT_NEGATIVE_SPACE_RATIO)
     
     # Depth zone calculations
-    if depth_specs["depth_zones"] == 3:
-        depth_zones = {
-            "foreground": {"distance_ft": 1.0, "scale": 1.0},
-            "midground": {"distance_ft": 3.5, "scale": 0.75},
-            "background": {"distance_ft": 6.0, "scale": 0.50}
-        }
-    elif depth_specs["depth_zones"] == 2:
-        depth_zones = {
-            "focal_plane": {"distance_ft": 2.0, "scale": 1.0},
-            "background": {"distance_ft": 5.0, "scale": 0.70}
-        }
-    else:
-        depth_zones = {
-            "single_plane": {"distance_ft": 0.5, "scale": 1.0}
-        }
+    depth_zones = _DEPTH_ZONE_LAYOUTS.get(depth_specs["depth_zones"], _DEFAULT_DEPTH_ZONES)
     
     return {
         "window_dimensions": {
@@ -439,7 +529,7 @@ def map_display_parameters(
         
     Returns: Complete geometric specifications for image generation
     """
-    result = _map_display_parameters_internal(
+    return _map_display_parameters_json(
         window_width_ft,
         window_height_ft,
         composition_type,
@@ -447,15 +537,142 @@ def map_display_parameters(
         lighting_framework,
         viewer_context
     )
-    result["layer"] = "deterministic_mapping"
-    result["cost_tokens"] = 0
+
+@functools.lru_cache(maxsize=2048, typed=True)
+def _map_display_parameters_json(
+    window_width_ft: float,
+    window_height_ft: float,
+    composition_type: str,
+    depth_staging: str,
+    lighting_framework: str,
+    viewer_context: str
+) -> str:
+    """Serialized map_display_parameters response, memoized per argument tuple."""
+    result = dict(
+        _map_display_parameters_internal(
+            window_width_ft,
+            window_height_ft,
+            composition_type,
+            depth_staging,
+            lighting_framework,
+            viewer_context
+        ),
+        layer="deterministic_mapping",
+        cost_tokens=0
+    )
     
-    return json.dumps(result, indent=2)
+    return _dumps(result)
 
 # ============================================================================
 # LAYER 3: IMAGE PROMPT SYNTHESIS
 # ============================================================================
 
+# Human-readable labels for every enum value that appears in prompt text
+_LABELS = {
+    value: value.replace('_', ' ')
+    for value in (
+        *COMPOSITION_TYPES,
+        *DEPTH_STAGING,
+        *LIGHTING_FRAMEWORKS,
+        *SIGHT_LINE_GEOMETRY,
+        *(specs["eye_movement"] for specs in COMPOSITION_TYPES.values()),
+        *(specs["shadow_quality"] for specs in LIGHTING_FRAMEWORKS.values()),
+    )
+}
+
+# Prompt sentence templates, filled in by generate_display_prompt
+_PROMPT_TEMPLATE = (
+    "Shop window display photograph: {subject}. "
+    "{style}"
+    "{composition} composition with {focal}. "
+    "{depth}. "
+    "{light}. "
+    "{view}. "
+    "{negative:.0%} negative space ratio, {eye_movement} eye movement pattern."
+)
+_STYLE_TEMPLATE = "Style: {style}. "
+_FOCAL_TEMPLATE = (
+    "primary focal point at {x:.2f} horizontal × {y:.2f} vertical "
+    "(measured from bottom-left)"
+)
+_DEPTH_INSTRUCTIONS = {
+    "theatrical_depth": (
+        "strong foreground/midground/background separation with "
+        "30% spatial compression, foreground at 1.0× scale, "
+        "midground at 0.75× scale, background at 0.50× scale"
+    ),
+    "compressed_2d": "flat composition maximizing window glass plane, minimal depth cues",
+    "shallow_focus": "photography-style depth with clear focal plane at 2ft, background at 5ft with 70% scale",
+}
+_DEPTH_FALLBACK_TEMPLATE = "{strategy} with {compression:.0%} compression"
+_UPLIGHT_TEMPLATE = "uplighting from {angle}° below horizontal"
+_KEY_LIGHT_TEMPLATE = "key light from {angle}° above horizontal"
+_LIGHT_TEMPLATE = (
+    "{direction}, {ratio:.1f}:1 intensity ratio to ambient fill, "
+    "{temperature}K color temperature, {shadow} shadows"
+)
+_VIEW_TEMPLATE = (
+    "composed for {context} perspective at "
+    "{angle}° viewing angle from {distance}ft distance, "
+    "eye height {eye_height}in"
+)
+
+@functools.lru_cache(maxsize=None)
+def _specialized_prompt_template(
+    composition_type: str,
+    depth_staging: str,
+    lighting_framework: str,
+    viewer_context: str
+) -> str:
+    """
+    Partially evaluate _PROMPT_TEMPLATE for one taxonomy combination.
+
+    Everything except the subject, style and focal coordinates is fixed by
+    the four enum choices, so those sentences are rendered once per
+    combination and the remaining {subject}, {style}, {x} and {y} fields
+    are left for generate_display_prompt to fill.
+    """
+    comp_specs = COMPOSITION_TYPES[composition_type]
+    depth_specs = DEPTH_STAGING[depth_staging]
+    light_specs = LIGHTING_FRAMEWORKS[lighting_framework]
+    sight_specs = SIGHT_LINE_GEOMETRY[viewer_context]
+    
+    # Depth instructions
+    depth_instruction = _DEPTH_INSTRUCTIONS.get(depth_staging)
+    if depth_instruction is None:
+        depth_instruction = _DEPTH_FALLBACK_TEMPLATE.format(
+            strategy=_LABELS[depth_staging],
+            compression=depth_specs["spatial_compression"]
+        )
+    
+    # Lighting instructions
+    if light_specs["key_angle"] < 0:
+        light_direction = _UPLIGHT_TEMPLATE.format(angle=abs(light_specs["key_angle"]))
+    else:
+        light_direction = _KEY_LIGHT_TEMPLATE.format(angle=light_specs["key_angle"])
+    
+    return _PROMPT_TEMPLATE.format(
+        subject="{subject}",
+        style="{style}",
+        composition=_LABELS[composition_type],
+        focal=_FOCAL_TEMPLATE,
+        depth=depth_instruction,
+        light=_LIGHT_TEMPLATE.format(
+            direction=light_direction,
+            ratio=light_specs["key_intensity_ratio"],
+            temperature=light_specs["color_temperature"],
+            shadow=_LABELS[light_specs["shadow_quality"]]
+        ),
+        view=_VIEW_TEMPLATE.format(
+            context=_LABELS[viewer_context],
+            angle=sight_specs["viewing_angle"],
+            distance=sight_specs["viewing_distance_ft"],
+            eye_height=sight_specs["eye_height_in"]
+        ),
+        negative=_NEGATIVE_SPACE_RATIOS.get(composition_type, _DEFAULT_NEGATIVE_SPACE_RATIO),
+        eye_movement=_LABELS[comp_specs["eye_movement"]]
+    )
+
 @mcp.tool()
 def generate_display_prompt(
     window_width_ft: float,
@@ -499,6 +716,34 @@ def generate_display_prompt(
         
     Returns: Complete image generation prompt with geometric specifications
     """
+    return _generate_display_prompt_json(
+        window_width_ft,
+        window_height_ft,
+        composition_type,
+        depth_staging,
+        lighting_framework,
+        viewer_context,
+        subject_description,
+        style_modifier
+    )
+
+@functools.lru_cache(maxsize=1024, typed=True)
+def _generate_display_prompt_json(
+    window_width_ft: float,
+    window_height_ft: float,
+    composition_type: str,
+    depth_staging: str,
+    lighting_framework: str,
+    viewer_context: str,
+    subject_description: str,
+    style_modifier: str
+) -> str:
+    """
+    Serialized generate_display_prompt response, memoized per argument tuple.
+
+    Refinement loops tend to reissue identical requests, which this turns
+    into a cache hit instead of a rebuild of the prompt and its parameters.
+    """
     # Get deterministic parameters (Layer 2) using internal function
     params = _map_display_parameters_internal(
         window_width_ft,
@@ -509,70 +754,20 @@ def generate_display_prompt(
         viewer_context
     )
     
-    # Build geometric prompt
-    comp = params["composition"]
-    depth = params["depth_staging"]
-    light = params["lighting"]
-    view = params["viewing_geometry"]
-    
-    # Composition instructions
-    comp_instruction = f"{composition_type.replace('_', ' ')} composition"
-    focal_instruction = (
-        f"primary focal point at {comp['primary_focal_point']['x_normalized']:.2f} "
-        f"horizontal × {comp['primary_focal_point']['y_normalized']:.2f} vertical "
-        f"(measured from bottom-left)"
-    )
-    
-    # Depth instructions
-    if depth["strategy"] == "theatrical_depth":
-        depth_instruction = (
-            "strong foreground/midground/background separation with "
-            f"30% spatial compression, foreground at 1.0× scale, "
-            f"midground at 0.75× scale, background at 0.50× scale"
-        )
-    elif depth["strategy"] == "compressed_2d":
-        depth_instruction = "flat composition maximizing window glass plane, minimal depth cues"
-    elif depth["strategy"] == "shallow_focus":
-        depth_instruction = "photography-style depth with clear focal plane at 2ft, background at 5ft with 70% scale"
-    else:
-        depth_instruction = f"{depth['strategy'].replace('_', ' ')} with {depth['spatial_compression']:.0%} compression"
-    
-    # Lighting instructions
-    if light["key_light_angle_deg"] < 0:
-        light_direction = f"uplighting from {abs(light['key_light_angle_deg'])}° below horizontal"
-    else:
-        light_direction = f"key light from {light['key_light_angle_deg']}° above horizontal"
-    
-    light_instruction = (
-        f"{light_direction}, {light['intensity_ratio']:.1f}:1 intensity ratio to ambient fill, "
-        f"{light['color_temperature_k']}K color temperature, {light['shadow_quality'].replace('_', ' ')} shadows"
-    )
-    
-    # Viewing geometry instructions
-    view_instruction = (
-        f"composed for {view['viewer_context'].replace('_', ' ')} perspective at "
-        f"{view['viewing_angle_deg']}° viewing angle from {view['viewing_distance_ft']}ft distance, "
-        f"eye height {view['eye_height_in']}in"
+    # Only the subject, style and focal point vary within a taxonomy combination
+    focal_point = params["composition"]["primary_focal_point"]
+    prompt = _specialized_prompt_template(
+        composition_type,
+        depth_staging,
+        lighting_framework,
+        viewer_context
+    ).format(
+        subject=subject_description,
+        style=_STYLE_TEMPLATE.format(style=style_modifier) if style_modifier else "",
+        x=focal_point["x_normalized"],
+        y=focal_point["y_normalized"]
     )
     
-    # Negative space instruction
-    negative_instruction = f"{comp['negative_space_ratio']:.0%} negative space ratio"
-    
-    # Assemble prompt
-    prompt_parts = [
-        f"Shop window display photograph: {subject_description}.",
-        f"{comp_instruction} with {focal_instruction}.",
-        f"{depth_instruction}.",
-        f"{light_instruction}.",
-        f"{view_instruction}.",
-        f"{negative_instruction}, {comp['eye_movement_pattern'].replace('_', ' ')} eye movement pattern."
-    ]
-    
-    if style_modifier:
-        prompt_parts.insert(1, f"Style: {style_modifier}.")
-    
-    prompt = " ".join(prompt_parts)
-    
     result = {
         "prompt": prompt,
         "parameters_used": params,
@@ -582,7 +777,7 @@ def generate_display_prompt(
         "note": "In production, this layer would call LLM for creative enhancement"
     }
     
-    return json.dumps(result, indent=2)
+    return _dumps(result)
 
 # ============================================================================
 # PHASE 2.6: NORMALIZED PARAMETER SPACE & RHYTHMIC COMPOSITION
@@ -599,16 +794,16 @@ def generate_display_prompt(
 #   negative_space_ratio   - packed/filled → open/breathable
 # ============================================================================
 
-DISPLAY_PARAMETER_NAMES = [
+DISPLAY_PARAMETER_NAMES = (
     "compositional_tension",
     "depth_complexity",
     "lighting_drama",
     "viewing_intimacy",
     "negative_space_ratio"
-]
+)
 
 # Canonical display states with normalized coordinates
-DISPLAY_STATE_COORDINATES = {
+DISPLAY_STATE_COORDINATES = MappingProxyType({
     "luxury_isolation": {
         "compositional_tension": 0.10,
         "depth_complexity": 0.40,
@@ -658,10 +853,21 @@ DISPLAY_STATE_COORDINATES = {
         "viewing_intimacy": 0.50,
         "negative_space_ratio": 0.35
     }
+})
+
+# Canonical states as rows ordered by DISPLAY_PARAMETER_NAMES; the dicts above
+# remain the JSON-facing form.
+_STATE_ROWS = {
+    name: tuple(coords[p] for p in DISPLAY_PARAMETER_NAMES)
+    for name, coords in DISPLAY_STATE_COORDINATES.items()
 }
 
+# State and preset names for error responses; lists rather than tuples so
+# the "Available: [...]" messages keep their existing formatting.
+_STATE_KEYS = list(DISPLAY_STATE_COORDINATES)
+
 # Phase 2.6 rhythmic presets: temporal oscillation between display states
-DISPLAY_RHYTHMIC_PRESETS = {
+DISPLAY_RHYTHMIC_PRESETS = MappingProxyType({
     "seasonal_transition": {
         "state_a": "editorial_minimal",
         "state_b": "theatrical_drama",
@@ -702,7 +908,9 @@ DISPLAY_RHYTHMIC_PRESETS = {
         "steps_per_cycle": 12,
         "description": "Hard cuts between minimal editorial and storytelling progression"
     }
-}
+})
+
+_PRESET_KEYS = list(DISPLAY_RHYTHMIC_PRESETS)
 
 
 # ============================================================================
@@ -713,7 +921,7 @@ DISPLAY_RHYTHMIC_PRESETS = {
 # nearest-neighbor matching against canonical visual types.
 # ============================================================================
 
-DISPLAY_VISUAL_TYPES = {
+DISPLAY_VISUAL_TYPES = MappingProxyType({
     "luxury_restraint": {
         "coords": {
             "compositional_tension": 0.10,
@@ -804,58 +1012,117 @@ DISPLAY_VISUAL_TYPES = {
             "multiple overlapping depth planes"
         ]
     }
-}
+})
+
+# Visual type coordinates as rows ordered by DISPLAY_PARAMETER_NAMES, so the
+# nearest-neighbor search works on flat tuples instead of nested dicts.
+_VISUAL_TYPE_NAMES = tuple(DISPLAY_VISUAL_TYPES)
+_VISUAL_TYPE_COORDS = tuple(
+    tuple(type_def["coords"].get(p, 0.5) for p in DISPLAY_PARAMETER_NAMES)
+    for type_def in DISPLAY_VISUAL_TYPES.values()
+)
+
+# Keyword lists per strength band, shared by every vocabulary result
+_KEYWORDS_SHORT = {name: type_def["keywords"][:3] for name, type_def in DISPLAY_VISUAL_TYPES.items()}
+_KEYWORDS_MEDIUM = {name: type_def["keywords"][:5] for name, type_def in DISPLAY_VISUAL_TYPES.items()}
+_KEYWORDS_FULL = {name: type_def["keywords"] for name, type_def in DISPLAY_VISUAL_TYPES.items()}
 
 
 # ============================================================================
 # PHASE 2.6 INTERNAL FUNCTIONS
 # ============================================================================
 
-import math
-
 def _generate_oscillation(num_steps: int, num_cycles: float, pattern: str) -> list:
     """Generate oscillation pattern values [0, 1]."""
-    result = []
-    for i in range(num_steps):
-        t = 2 * math.pi * num_cycles * i / num_steps
-        if pattern == "sinusoidal":
-            val = 0.5 * (1 + math.sin(t))
-        elif pattern == "triangular":
-            t_norm = (t / (2 * math.pi)) % 1.0
-            val = 2 * t_norm if t_norm < 0.5 else 2 * (1 - t_norm)
-        elif pattern == "square":
-            t_norm = (t / (2 * math.pi)) % 1.0
-            val = 0.0 if t_norm < 0.5 else 1.0
-        else:
-            val = 0.5
-        result.append(val)
-    return result
+    # Pattern is dispatched once; each branch is a single comprehension
+    two_pi = 2 * math.pi
+    scale = two_pi * num_cycles
+    if pattern == "sinusoidal":
+        sin = math.sin
+        return [0.5 * (1 + sin(scale * i / num_steps)) for i in range(num_steps)]
+    if pattern == "triangular":
+        t_norms = [(scale * i / num_steps / two_pi) % 1.0 for i in range(num_steps)]
+        return [2 * t if t < 0.5 else 2 * (1 - t) for t in t_norms]
+    if pattern == "square":
+        return [
+            0.0 if (scale * i / num_steps / two_pi) % 1.0 < 0.5 else 1.0
+            for i in range(num_steps)
+        ]
+    return [0.5] * num_steps
 
 
+@functools.lru_cache(maxsize=None)
 def _generate_preset_trajectory(preset_name: str) -> list:
     """
     Generate Phase 2.6 preset trajectory as list of state dicts.
 
+    Presets are fixed, so each trajectory is computed once and memoized;
+    the returned list is shared between callers and must not be mutated.
+
     Returns:
         List of dicts, each mapping parameter names to float values.
         Length = num_cycles × steps_per_cycle.
     """
     config = DISPLAY_RHYTHMIC_PRESETS[preset_name]
-    state_a = DISPLAY_STATE_COORDINATES[config["state_a"]]
-    state_b = DISPLAY_STATE_COORDINATES[config["state_b"]]
-
     total_steps = config["num_cycles"] * config["steps_per_cycle"]
     alphas = _generate_oscillation(total_steps, config["num_cycles"], config["pattern"])
 
+    return _interpolate_states(
+        _STATE_ROWS[config["state_a"]],
+        _STATE_ROWS[config["state_b"]],
+        alphas
+    )
+
+
+def _interpolate_states(row_a: tuple, row_b: tuple, alphas: list) -> list:
+    """
+    Linearly blend two parameter rows at each alpha in one pass.
+
+    Args:
+        row_a: Start coordinates ordered as DISPLAY_PARAMETER_NAMES.
+        row_b: End coordinates ordered as DISPLAY_PARAMETER_NAMES.
+        alphas: Blend weights, 0.0 = row_a and 1.0 = row_b.
+
+    Oscillations revisit the same alphas every cycle (a square wave has only
+    two), so each distinct alpha is blended and rounded once and repeated
+    steps share that state dict.
+
+    Returns:
+        List of dicts mapping parameter names to values rounded to 4 places.
+    """
+    endpoints = tuple(zip(DISPLAY_PARAMETER_NAMES, row_a, row_b))
+    blended = {}
     trajectory = []
     for alpha in alphas:
-        state = {}
-        for p in DISPLAY_PARAMETER_NAMES:
-            state[p] = round(state_a[p] * (1 - alpha) + state_b[p] * alpha, 4)
+        state = blended.get(alpha)
+        if state is None:
+            beta = 1 - alpha
+            state = blended[alpha] = {
+                p: round(a * beta + b * alpha, 4) for p, a, b in endpoints
+            }
         trajectory.append(state)
     return trajectory
 
 
+def _nearest_visual_type(query: tuple) -> tuple:
+    """
+    Find the visual type closest to a query point in parameter space.
+
+    Args:
+        query: Coordinates ordered as DISPLAY_PARAMETER_NAMES.
+
+    Returns:
+        (index into _VISUAL_TYPE_NAMES, Euclidean distance) of the nearest type.
+    """
+    dist_sq = [
+        sum((q - c) ** 2 for q, c in zip(query, coords))
+        for coords in _VISUAL_TYPE_COORDS
+    ]
+    # sqrt is monotonic, so rank by squared distance and take one root
+    nearest_idx = min(range(len(dist_sq)), key=dist_sq.__getitem__)
+    return nearest_idx, math.sqrt(dist_sq[nearest_idx])
+
+
 def _extract_visual_vocabulary(state: dict, strength: float = 1.0) -> dict:
     """
     Map parameter coordinates to nearest canonical visual type.
@@ -871,29 +1138,17 @@ def _extract_visual_vocabulary(state: dict, strength: float = 1.0) -> dict:
     Returns:
         Dict with nearest_type, distance, keywords, and state echo.
     """
-    min_dist = float("inf")
-    nearest_type = None
-
-    for type_name, type_def in DISPLAY_VISUAL_TYPES.items():
-        coords = type_def["coords"]
-        dist_sq = sum(
-            (state.get(p, 0.5) - coords.get(p, 0.5)) ** 2
-            for p in DISPLAY_PARAMETER_NAMES
-        )
-        dist = math.sqrt(dist_sq)
-        if dist < min_dist:
-            min_dist = dist
-            nearest_type = type_name
-
-    type_def = DISPLAY_VISUAL_TYPES[nearest_type]
+    query = tuple(state.get(p, 0.5) for p in DISPLAY_PARAMETER_NAMES)
+    nearest_idx, min_dist = _nearest_visual_type(query)
+    nearest_type = _VISUAL_TYPE_NAMES[nearest_idx]
 
     # Weight keywords by strength (filter if very low)
     if strength < 0.2:
-        keywords = type_def["keywords"][:3]
+        keywords = _KEYWORDS_SHORT[nearest_type]
     elif strength < 0.5:
-        keywords = type_def["keywords"][:5]
+        keywords = _KEYWORDS_MEDIUM[nearest_type]
     else:
-        keywords = list(type_def["keywords"])
+        keywords = _KEYWORDS_FULL[nearest_type]
 
     return {
         "nearest_type": nearest_type,
@@ -904,6 +1159,65 @@ def _extract_visual_vocabulary(state: dict, strength: float = 1.0) -> dict:
     }
 
 
+@functools.lru_cache(maxsize=None)
+def _preset_step_vocabulary(preset_name: str, step: int) -> dict:
+    """
+    Visual vocabulary for one step of a preset trajectory.
+
+    Keyframe extraction keeps landing on the same few steps of the same
+    fixed trajectories, so each step's nearest-type match is computed once.
+    The returned dict is shared and must not be mutated.
+    """
+    return _extract_visual_vocabulary(_generate_preset_trajectory(preset_name)[step])
+
+
+def _attractor_prompt(keywords: list, style_modifier: str = "") -> str:
+    """Join visual keywords into an image prompt, optionally style-prefixed."""
+    prefix = f"{style_modifier}, " if style_modifier else ""
+    return f"{prefix}Shop window display photograph:, {', '.join(keywords)}"
+
+
+# ============================================================================
+# PHASE 2.6 SERIALIZED RESPONSES
+# ============================================================================
+#
+# Zero-argument listings depend only on the fixed taxonomy above, so they
+# are serialized once at import, like the Layer 1 responses.
+# ============================================================================
+
+_LIST_STATES_JSON = _dumps({
+    "display_states": dict(DISPLAY_STATE_COORDINATES),
+    "parameter_names": DISPLAY_PARAMETER_NAMES,
+    "parameter_semantics": {
+        "compositional_tension": "0.0 = sparse isolation, 1.0 = dense dynamic",
+        "depth_complexity": "0.0 = flat 2D plane, 1.0 = deep theatrical staging",
+        "lighting_drama": "0.0 = soft ambient even, 1.0 = harsh theatrical accent",
+        "viewing_intimacy": "0.0 = distant/passing, 1.0 = close/detailed",
+        "negative_space_ratio": "0.0 = packed/filled, 1.0 = open/breathable"
+    },
+    "count": len(DISPLAY_STATE_COORDINATES),
+    "layer": "taxonomy",
+    "cost_tokens": 0
+})
+
+_LIST_PRESETS_JSON = _dumps({
+    "presets": {
+        name: {
+            "period": config["steps_per_cycle"],
+            "total_steps": config["num_cycles"] * config["steps_per_cycle"],
+            "pattern": config["pattern"],
+            "states": f"{config['state_a']} ↔ {config['state_b']}",
+            "description": config["description"]
+        }
+        for name, config in DISPLAY_RHYTHMIC_PRESETS.items()
+    },
+    "count": len(DISPLAY_RHYTHMIC_PRESETS),
+    "available_patterns": ["sinusoidal", "triangular", "square"],
+    "layer": "taxonomy",
+    "cost_tokens": 0
+})
+
+
 # ============================================================================
 # PHASE 2.6 TOOLS: RHYTHMIC COMPOSITION
 # ============================================================================
@@ -917,20 +1231,7 @@ def list_display_states() -> str:
 
     Returns: All 7 canonical display states in normalized parameter space.
     """
-    return json.dumps({
-        "display_states": DISPLAY_STATE_COORDINATES,
-        "parameter_names": DISPLAY_PARAMETER_NAMES,
-        "parameter_semantics": {
-            "compositional_tension": "0.0 = sparse isolation, 1.0 = dense dynamic",
-            "depth_complexity": "0.0 = flat 2D plane, 1.0 = deep theatrical staging",
-            "lighting_drama": "0.0 = soft ambient even, 1.0 = harsh theatrical accent",
-            "viewing_intimacy": "0.0 = distant/passing, 1.0 = close/detailed",
-            "negative_space_ratio": "0.0 = packed/filled, 1.0 = open/breathable"
-        },
-        "count": len(DISPLAY_STATE_COORDINATES),
-        "layer": "taxonomy",
-        "cost_tokens": 0
-    }, indent=2)
+    return _LIST_STATES_JSON
 
 
 @mcp.tool()
@@ -942,23 +1243,7 @@ def list_display_rhythmic_presets() -> str:
 
     Returns: Preset configurations with periods, patterns, and descriptions.
     """
-    presets_summary = {}
-    for name, config in DISPLAY_RHYTHMIC_PRESETS.items():
-        presets_summary[name] = {
-            "period": config["steps_per_cycle"],
-            "total_steps": config["num_cycles"] * config["steps_per_cycle"],
-            "pattern": config["pattern"],
-            "states": f"{config['state_a']} ↔ {config['state_b']}",
-            "description": config["description"]
-        }
-
-    return json.dumps({
-        "presets": presets_summary,
-        "count": len(presets_summary),
-        "available_patterns": ["sinusoidal", "triangular", "square"],
-        "layer": "taxonomy",
-        "cost_tokens": 0
-    }, indent=2)
+    return _LIST_PRESETS_JSON
 
 
 @mcp.tool()
@@ -990,33 +1275,26 @@ def generate_display_rhythmic_sequence(
     Cost: 0 tokens (Layer 2 deterministic)
     """
     if state_a_id not in DISPLAY_STATE_COORDINATES:
-        return json.dumps({"error": f"Unknown state: {state_a_id}. Available: {list(DISPLAY_STATE_COORDINATES.keys())}"})
+        return _dumps({"error": f"Unknown state: {state_a_id}. Available: {_STATE_KEYS}"})
     if state_b_id not in DISPLAY_STATE_COORDINATES:
-        return json.dumps({"error": f"Unknown state: {state_b_id}. Available: {list(DISPLAY_STATE_COORDINATES.keys())}"})
+        return _dumps({"error": f"Unknown state: {state_b_id}. Available: {_STATE_KEYS}"})
 
-    state_a = DISPLAY_STATE_COORDINATES[state_a_id]
-    state_b = DISPLAY_STATE_COORDINATES[state_b_id]
     total_steps = num_cycles * steps_per_cycle
 
     alphas = _generate_oscillation(total_steps, num_cycles, oscillation_pattern)
 
-    # Apply phase offset
-    if phase_offset > 0:
-        offset_steps = int(phase_offset * steps_per_cycle)
+    # Apply phase offset (skipped when it amounts to less than one step)
+    offset_steps = int(phase_offset * steps_per_cycle) if phase_offset > 0 else 0
+    if offset_steps:
         alphas = alphas[offset_steps:] + alphas[:offset_steps]
 
-    sequence = []
-    for i, alpha in enumerate(alphas):
-        state = {}
-        for p in DISPLAY_PARAMETER_NAMES:
-            state[p] = round(state_a[p] * (1 - alpha) + state_b[p] * alpha, 4)
-        sequence.append({
-            "step": i,
-            "phase": round(alpha, 4),
-            "state": state
-        })
+    states = _interpolate_states(_STATE_ROWS[state_a_id], _STATE_ROWS[state_b_id], alphas)
+    sequence = [
+        {"step": i, "phase": round(alpha, 4), "state": state}
+        for i, (alpha, state) in enumerate(zip(alphas, states))
+    ]
 
-    return json.dumps({
+    return _dumps({
         "state_a": state_a_id,
         "state_b": state_b_id,
         "pattern": oscillation_pattern,
@@ -1028,7 +1306,7 @@ def generate_display_rhythmic_sequence(
         "sequence": sequence,
         "layer": "deterministic_composition",
         "cost_tokens": 0
-    }, indent=2)
+    })
 
 
 @mcp.tool()
@@ -1056,15 +1334,21 @@ def apply_display_rhythmic_preset(
     Cost: 0 tokens (Layer 2 deterministic)
     """
     if preset_name not in DISPLAY_RHYTHMIC_PRESETS:
-        return json.dumps({
+        return _dumps({
             "error": f"Unknown preset: {preset_name}",
-            "available": list(DISPLAY_RHYTHMIC_PRESETS.keys())
+            "available": _PRESET_KEYS
         })
 
+    return _preset_response_json(preset_name)
+
+
+@functools.lru_cache(maxsize=None)
+def _preset_response_json(preset_name: str) -> str:
+    """Serialized apply_display_rhythmic_preset response for a known preset."""
     config = DISPLAY_RHYTHMIC_PRESETS[preset_name]
     trajectory = _generate_preset_trajectory(preset_name)
 
-    return json.dumps({
+    return _dumps({
         "preset": preset_name,
         "description": config["description"],
         "state_a": config["state_a"],
@@ -1076,7 +1360,7 @@ def apply_display_rhythmic_preset(
         "trajectory": trajectory,
         "layer": "deterministic_composition",
         "cost_tokens": 0
-    }, indent=2)
+    })
 
 
 # ============================================================================
@@ -1111,7 +1395,7 @@ def extract_display_visual_vocabulary(
     result = _extract_visual_vocabulary(state, strength)
     result["layer"] = "deterministic_mapping"
     result["cost_tokens"] = 0
-    return json.dumps(result, indent=2)
+    return _dumps(result)
 
 
 @mcp.tool()
@@ -1150,8 +1434,8 @@ def generate_display_attractor_prompt(
     if mode == "sequence":
         # Sequence mode: extract keyframes from preset trajectory
         if not preset_name or preset_name not in DISPLAY_RHYTHMIC_PRESETS:
-            return json.dumps({
-                "error": f"Sequence mode requires valid preset_name. Available: {list(DISPLAY_RHYTHMIC_PRESETS.keys())}"
+            return _dumps({
+                "error": f"Sequence mode requires valid preset_name. Available: {_PRESET_KEYS}"
             })
 
         trajectory = _generate_preset_trajectory(preset_name)
@@ -1162,21 +1446,16 @@ def generate_display_attractor_prompt(
         keyframes = []
         for idx in indices:
             state = trajectory[idx]
-            vocab = _extract_visual_vocabulary(state)
-            prompt_parts = []
-            if style_modifier:
-                prompt_parts.append(style_modifier)
-            prompt_parts.append("Shop window display photograph:")
-            prompt_parts.extend(vocab["keywords"])
+            vocab = _preset_step_vocabulary(preset_name, idx)
             keyframes.append({
                 "step": idx,
                 "state": state,
                 "vocabulary": vocab,
-                "prompt": ", ".join(prompt_parts)
+                "prompt": _attractor_prompt(vocab["keywords"], style_modifier)
             })
 
         config = DISPLAY_RHYTHMIC_PRESETS[preset_name]
-        return json.dumps({
+        return _dumps({
             "mode": "sequence",
             "preset": preset_name,
             "description": config["description"],
@@ -1185,7 +1464,7 @@ def generate_display_attractor_prompt(
             "keyframes": keyframes,
             "layer": "deterministic_mapping",
             "cost_tokens": 0
-        }, indent=2)
+        })
 
     else:
         # Composite mode: single prompt from one state
@@ -1201,28 +1480,23 @@ def generate_display_attractor_prompt(
             state = trajectory[len(trajectory) // 2]
             source = f"preset_midpoint:{preset_name}"
         else:
-            return json.dumps({
+            return _dumps({
                 "error": "Provide custom_state dict or valid preset_name/state name.",
-                "available_states": list(DISPLAY_STATE_COORDINATES.keys()),
-                "available_presets": list(DISPLAY_RHYTHMIC_PRESETS.keys())
+                "available_states": _STATE_KEYS,
+                "available_presets": _PRESET_KEYS
             })
 
         vocab = _extract_visual_vocabulary(state)
-        prompt_parts = []
-        if style_modifier:
-            prompt_parts.append(style_modifier)
-        prompt_parts.append("Shop window display photograph:")
-        prompt_parts.extend(vocab["keywords"])
-        prompt = ", ".join(prompt_parts)
-
-        return json.dumps({
+        prompt = _attractor_prompt(vocab["keywords"], style_modifier)
+
+        return _dumps({
             "mode": "composite",
             "source": source,
             "prompt": prompt,
             "vocabulary": vocab,
             "layer": "deterministic_mapping",
             "cost_tokens": 0
-        }, indent=2)
+        })
 
 
 @mcp.tool()
@@ -1279,82 +1553,82 @@ def compute_display_state_distance(
         Distance value and per-parameter breakdown.
     """
     if state_a_id not in DISPLAY_STATE_COORDINATES:
-        return json.dumps({"error": f"Unknown state: {state_a_id}. Available: {list(DISPLAY_STATE_COORDINATES.keys())}"})
+        return _dumps({"error": f"Unknown state: {state_a_id}. Available: {_STATE_KEYS}"})
     if state_b_id not in DISPLAY_STATE_COORDINATES:
-        return json.dumps({"error": f"Unknown state: {state_b_id}. Available: {list(DISPLAY_STATE_COORDINATES.keys())}"})
+        return _dumps({"error": f"Unknown state: {state_b_id}. Available: {_STATE_KEYS}"})
 
-    a = DISPLAY_STATE_COORDINATES[state_a_id]
-    b = DISPLAY_STATE_COORDINATES[state_b_id]
-
-    components = {}
-    total_sq = 0.0
-    for p in DISPLAY_PARAMETER_NAMES:
-        diff = b[p] - a[p]
-        components[p] = round(diff, 4)
-        total_sq += diff ** 2
+    diffs = [
+        b - a for a, b in zip(_STATE_ROWS[state_a_id], _STATE_ROWS[state_b_id])
+    ]
+    distance = math.sqrt(sum(diff * diff for diff in diffs))
 
-    distance = math.sqrt(total_sq)
+    # Pair differences back with parameter names only for the response
+    components = {
+        p: round(diff, 4) for p, diff in zip(DISPLAY_PARAMETER_NAMES, diffs)
+    }
 
-    return json.dumps({
+    return _dumps({
         "state_a": state_a_id,
         "state_b": state_b_id,
         "euclidean_distance": round(distance, 4),
         "parameter_differences": components,
         "layer": "deterministic_computation",
         "cost_tokens": 0
-    }, indent=2)
+    })
 
 
 # ============================================================================
 # UPDATED SERVER INFO
 # ============================================================================
 
+_SERVER_INFO_JSON = _dumps({
+    "name": "Window Display Visual Merchandising MCP",
+    "version": "0.2.0",
+    "description": "Shop window display composition, lighting, and aesthetic dynamics vocabulary",
+    "architecture": "Three-layer olog pattern + Phase 2.6/2.7 dynamics",
+    "layers": {
+        "layer_1": "Pure taxonomy (composition types, lighting frameworks, sight lines, display states)",
+        "layer_2": "Deterministic parameter mapping (geometric calculations, rhythmic composition, vocabulary extraction)",
+        "layer_3": "Image prompt synthesis (structured prompts, attractor visualization)"
+    },
+    "cost_optimization": "Layers 1-2 are zero-cost deterministic operations",
+    "domains": [
+        "Visual merchandising",
+        "Retail display",
+        "Product photography",
+        "Commercial composition"
+    ],
+    "phase_2_6_enhancements": {
+        "rhythmic_composition": True,
+        "parameter_names": DISPLAY_PARAMETER_NAMES,
+        "canonical_states": _STATE_KEYS,
+        "rhythmic_presets": {
+            name: {
+                "period": cfg["steps_per_cycle"],
+                "pattern": cfg["pattern"],
+                "states": f"{cfg['state_a']} ↔ {cfg['state_b']}"
+            }
+            for name, cfg in DISPLAY_RHYTHMIC_PRESETS.items()
+        },
+        "preset_periods": sorted(set(
+            cfg["steps_per_cycle"] for cfg in DISPLAY_RHYTHMIC_PRESETS.values()
+        ))
+    },
+    "phase_2_7_enhancements": {
+        "attractor_visualization": True,
+        "visual_types": list(DISPLAY_VISUAL_TYPES.keys()),
+        "prompt_modes": ["composite", "sequence"]
+    },
+    "composition_types": list(COMPOSITION_TYPES.keys()),
+    "lighting_frameworks": list(LIGHTING_FRAMEWORKS.keys()),
+    "depth_staging_options": list(DEPTH_STAGING.keys()),
+    "viewer_contexts": list(SIGHT_LINE_GEOMETRY.keys())
+})
+
 @mcp.tool()
 def get_server_info() -> str:
     """Get information about the Window Display MCP server."""
-    return json.dumps({
-        "name": "Window Display Visual Merchandising MCP",
-        "version": "0.2.0",
-        "description": "Shop window display composition, lighting, and aesthetic dynamics vocabulary",
-        "architecture": "Three-layer olog pattern + Phase 2.6/2.7 dynamics",
-        "layers": {
-            "layer_1": "Pure taxonomy (composition types, lighting frameworks, sight lines, display states)",
-            "layer_2": "Deterministic parameter mapping (geometric calculations, rhythmic composition, vocabulary extraction)",
-            "layer_3": "Image prompt synthesis (structured prompts, attractor visualization)"
-        },
-        "cost_optimization": "Layers 1-2 are zero-cost deterministic operations",
-        "domains": [
-            "Visual merchandising",
-            "Retail display",
-            "Product photography",
-            "Commercial composition"
-        ],
-        "phase_2_6_enhancements": {
-            "rhythmic_composition": True,
-            "parameter_names": DISPLAY_PARAMETER_NAMES,
-            "canonical_states": list(DISPLAY_STATE_COORDINATES.keys()),
-            "rhythmic_presets": {
-                name: {
-                    "period": cfg["steps_per_cycle"],
-                    "pattern": cfg["pattern"],
-                    "states": f"{cfg['state_a']} ↔ {cfg['state_b']}"
-                }
-                for name, cfg in DISPLAY_RHYTHMIC_PRESETS.items()
-            },
-            "preset_periods": sorted(set(
-                cfg["steps_per_cycle"] for cfg in DISPLAY_RHYTHMIC_PRESETS.values()
-            ))
-        },
-        "phase_2_7_enhancements": {
-            "attractor_visualization": True,
-            "visual_types": list(DISPLAY_VISUAL_TYPES.keys()),
-            "prompt_modes": ["composite", "sequence"]
-        },
-        "composition_types": list(COMPOSITION_TYPES.keys()),
-        "lighting_frameworks": list(LIGHTING_FRAMEWORKS.keys()),
-        "depth_staging_options": list(DEPTH_STAGING.keys()),
-        "viewer_contexts": list(SIGHT_LINE_GEOMETRY.keys())
-    }, indent=2)
+    return _SERVER_INFO_JSON
 
 if __name__ == "__main__":
     mcp.run()